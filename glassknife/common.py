@@ -2,29 +2,51 @@
 
 import datetime as dt
 import logging
-import re
+import os
 from pathlib import Path
 from typing import List, Tuple
 
 LOG = logging.getLogger(__name__)
-NOTE_FILENAME_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})\.md$")
 
 
 def daily_note_files(daily_notes_dir: Path) -> List[Tuple[Path, dt.date]]:
     """Return a list of Daily Notes and their dates."""
 
-    notes = []
-
-    for note in daily_notes_dir.glob("*-*-*.md"):
-        name = note.name
-        if not (match := NOTE_FILENAME_PATTERN.match(name)):
-            LOG.debug("%r matches the filename glob but not the validation regex", name)
-            continue
-
-        year, month, day = match.groups()
-        notes.append((note, dt.date(int(year), int(month), int(day))))
-
-    return sorted(notes)
+    # Sort on the "YYYY-MM-DD.md" names, which is much cheaper than comparing Paths.
+    notes: List[Tuple[str, str, dt.date]] = []
+
+    try:
+        entries = os.scandir(daily_notes_dir)
+    except FileNotFoundError:
+        LOG.debug("The daily notes directory %r doesn't exist", str(daily_notes_dir))
+        return []
+
+    with entries:
+        for entry in entries:
+            # Daily notes are named like "YYYY-MM-DD.md".
+            name = entry.name
+            year, month, day = name[0:4], name[5:7], name[8:10]
+            if not (
+                len(name) == 13
+                and name.isascii()
+                and name.endswith(".md")
+                and name[4] == name[7] == "-"
+                and year.isdigit()
+                and month.isdigit()
+                and day.isdigit()
+            ):
+                continue
+
+            try:
+                note_date = dt.date(int(year), int(month), int(day))
+            except ValueError:
+                LOG.debug("%r is shaped like a daily note but isn't a valid date", name)
+                continue
+
+            notes.append((name, entry.path, note_date))
+
+    notes.sort()
+    return [(Path(path), note_date) for _, path, note_date in notes]
 
 
 def logging_verbosity(verbose: int):
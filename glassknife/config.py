@@ -1,14 +1,25 @@
 """glassknife config handler."""
 
+import os
+import pickle
+from contextlib import suppress
 from functools import cache
 from pathlib import Path
 from typing import Dict
 
 import yaml
 from pydantic import BaseModel
-from xdg import xdg_config_home
+from xdg import xdg_cache_home, xdg_config_home
+
+from glassknife import __version__
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore
 
 CONFIG_FILE = xdg_config_home() / "glassknife" / "config.yaml"
+CONFIG_CACHE_FILE = xdg_cache_home() / "glassknife" / "config.pkl"
 
 
 class Vault(BaseModel):
@@ -47,8 +58,32 @@ class Config(BaseModel):
 
 @cache
 def load_config():
-    """Fetch the stored config from its YAML file."""
-
-    conf = yaml.safe_load(CONFIG_FILE.read_text())
-
-    return Config.parse_obj(conf)
+    """Fetch the stored config, preferring the pickled copy if it was made from this YAML file.
+
+    The pickle is only used if it was written by this version of glassknife from a YAML file with
+    exactly the same mtime and size as the current one.
+    """
+
+    src_stat = CONFIG_FILE.stat()
+    cache_key = (__version__, src_stat.st_mtime_ns, src_stat.st_size)
+    try:
+        cached_key, cached_config = pickle.loads(CONFIG_CACHE_FILE.read_bytes())
+        if cached_key == cache_key:
+            return cached_config
+    except Exception:  # pylint: disable=broad-except
+        # The cache is only an optimization, so a missing or damaged one means re-reading the YAML.
+        pass
+
+    conf = yaml.load(CONFIG_FILE.read_bytes(), Loader=_Loader)
+    config = Config.parse_obj(conf)
+
+    tmp_file = CONFIG_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(pickle.dumps((cache_key, config)))
+        os.replace(tmp_file, CONFIG_CACHE_FILE)
+    except OSError:
+        with suppress(OSError):
+            tmp_file.unlink()
+
+    return config
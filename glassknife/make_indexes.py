@@ -6,6 +6,7 @@ import argparse
 import datetime as dt
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Dict, List
 
@@ -14,17 +15,35 @@ from glassknife.config import Vault, load_config
 
 LOG = logging.getLogger(__name__)
 
+# How many bytes bigger or smaller than the template file a note can be and still be compared to it
+EMPTY_NOTE_SLACK = 64
+
+# A "---" line separating an index file's header, links, and footer
+SEPARATOR_PATTERN = re.compile(r"^---\n", re.MULTILINE)
+
+
+def template_path(vault: Vault) -> Path:
+    """Return the path to the Daily Note template file."""
+
+    return vault.templates_dir / vault.daily_template_name
+
 
 def template_contents(vault: Vault) -> str:
     """Return the contents of the Daily Note template file."""
 
-    return (vault.templates_dir / vault.daily_template_name).read_text()
+    return template_path(vault).read_text()
 
 
-def valid_grouped_note_files(vault: Vault) -> Dict[int, Dict[int, List[str]]]:
+def valid_grouped_note_files(vault: Vault, template: str) -> Dict[int, Dict[int, List[str]]]:
     """Yield a series of note filenames and the year, month, and day of their creation."""
 
-    empty_template = template_contents(vault).strip()
+    empty_template = template.strip()
+    # Compare on-disk sizes to on-disk sizes so that the text encoding doesn't matter, and allow
+    # for a "\r\n" vs. "\n" difference on every line in case the note and template don't agree.
+    template_size = template_path(vault).stat().st_size
+    slack = EMPTY_NOTE_SLACK + template.count("\n")
+    min_size = template_size - slack
+    max_size = template_size + slack
 
     grouped: Dict[int, Dict[int, List[str]]] = {}
 
@@ -34,7 +53,11 @@ def valid_grouped_note_files(vault: Vault) -> Dict[int, Dict[int, List[str]]]:
         name = note.name
         LOG.info("Found %s", name)
 
-        if note_date < today and note.read_text().strip() == empty_template:
+        if (
+            note_date < today
+            and min_size <= note.stat().st_size <= max_size
+            and note.read_text().strip() == empty_template
+        ):
             LOG.info("%r is empty -- pruning", name)
             note.unlink()
             continue
@@ -47,7 +70,9 @@ def valid_grouped_note_files(vault: Vault) -> Dict[int, Dict[int, List[str]]]:
 def make_indexes(vault: Vault):
     """Create yearly and monthly index files for existing notes."""
 
-    for year, months in valid_grouped_note_files(vault).items():
+    template = template_contents(vault)
+
+    for year, months in valid_grouped_note_files(vault, template).items():
         yearname = f"Daily notes - {year}"
         yearpath = vault.path / f"{yearname}.md"
 
@@ -77,7 +102,7 @@ def make_indexes(vault: Vault):
         LOG.debug("The tomorrow file %r already exists", tomorrow_file.name)
     else:
         LOG.debug("Creating the empty tomorrow file %r", tomorrow_file.name)
-        tomorrow_file.write_text(template_contents(vault))
+        tomorrow_file.write_text(template)
 
 
 def touch(path: Path, year: int, month: int):
@@ -92,38 +117,20 @@ def write_index_file(path, default_header, links, default_footer):
 
     if path.exists():
         LOG.debug("Editing existing file %r", path.name)
-        with path.open() as infile:
-            header = []
-            footer = []
-            for line in infile:
-                if line == "---\n":
-                    break
-                header.append(line.rstrip("\n"))
-
-            for line in infile:
-                if line == "---\n":
-                    break
-
-            for line in infile:
-                footer.append(line.rstrip("\n"))
-
-        if header and not header[-1]:
-            del header[-1]
-
-        if footer and not footer[0]:
-            del footer[0]
+        parts = SEPARATOR_PATTERN.split(path.read_text(), maxsplit=2)
+        header = parts[0].rstrip("\n").split("\n")
+        footer = parts[2].lstrip("\n").removesuffix("\n").split("\n") if len(parts) == 3 else []
 
     else:
         LOG.debug("Writing new file %r", path.name)
         header = default_header
         footer = default_footer
 
+    separator = "\n\n---\n\n"
     with path.open("w") as outfile:
-        outfile.write("\n".join(header))
-        outfile.write("\n\n---\n\n")
-        outfile.write("\n".join(links))
-        outfile.write("\n\n---\n\n")
-        outfile.write("\n".join(footer))
+        outfile.writelines(
+            ["\n".join(header), separator, "\n".join(links), separator, "\n".join(footer)]
+        )
 
 
 def handle_command_line():
@@ -7,8 +7,8 @@ import datetime as dt
 import logging
 import re
 import subprocess
-import webbrowser
-from typing import Callable, Dict, List, Tuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 from glassknife.common import daily_note_files, logging_verbosity
@@ -17,17 +17,10 @@ from glassknife.config import Vault, load_config, ProcessNotes
 LOG = logging.getLogger(__name__)
 UNPROCESSED = "#unprocessed"
 
-LINK_PATTERN = re.compile(
-    r"""
-\[\[                # Opening brackets
-    (?:[^\]]*?\|)?  # Optionally, anything but brackets up until "|"
-    ([^]]*?)        # The rest of the string until...
-\]\]                # Closing brackets
-""",
-    re.VERBOSE,
-)
-
-ActionFunc = Callable[[str, bool], None]
+# "[[", then optionally anything but "|" or "]" up until "|", then the captured rest until "]]".
+LINK_PATTERN = re.compile(r"\[\[(?:[^|\]]*\|)?([^\]]*?)\]\]")
+
+ActionFunc = Callable[[List[str], bool], None]
 ACTIONS: Dict[str, ActionFunc] = {}
 
 
@@ -41,61 +34,96 @@ def register(name):
     return outer
 
 
+def open_urls(urls: List[str]):
+    """Open the URLs with macOS's "open" command, which accepts several of them at once.
+
+    Failures are logged instead of raised so that the rest of a note's actions still run.
+    """
+
+    try:
+        result = subprocess.run(["/usr/bin/open", *urls], check=False)
+    except OSError as exc:
+        LOG.error("Couldn't run open for %r: %s", urls, exc)
+        return
+
+    if result.returncode:
+        LOG.error("open exited with status %d for %r", result.returncode, urls)
+
+
 @register("Day One")
-def send_to_dayone(text: str, dry_run: bool):
-    """Create a Day One journal entry from the text."""
+def send_to_dayone(items: List[str], dry_run: bool):
+    """Create a single Day One journal entry from all the items."""
 
+    text = "\n\n".join(items)
     LOG.info("Sending to Day One: %r", text)
     if not dry_run:
-        webbrowser.open(f"dayone2://post?entry={quote(text)}")
+        open_urls([f"dayone2://post?entry={quote(text)}"])
 
 
 @register("OmniFocus")
-def send_to_omnifocus(text: str, dry_run: bool):
-    """Create an OmniFocus action from the text."""
+def send_to_omnifocus(items: List[str], dry_run: bool):
+    """Create an OmniFocus action from each of the items."""
 
-    LOG.info("Sending to OmniFocus: %r", text)
+    urls = []
+    for text in items:
+        LOG.info("Sending to OmniFocus: %r", text)
+        urls.append(f"omnifocus://x-callback-url/add?name={quote(text)}&autosave=true")
     if not dry_run:
-        webbrowser.open(f"omnifocus://x-callback-url/add?name={quote(text)}&autosave=true")
+        open_urls(urls)
 
 
 @register("Reminders")
-def send_to_reminders(text: str, dry_run: bool):
-    """Create a Reminders item from the text."""
+def send_to_reminders(items: List[str], dry_run: bool):
+    """Create a Reminders item from each of the items."""
 
-    LOG.info("Sending to Reminders: %r", text)
-    if not dry_run:
-        # This uses the command line "reminders" tool from https://github.com/keith/reminders-cli
-        subprocess.run(["/usr/local/bin/reminders", "add", "Inbox", text], check=True)
+    for text in items:
+        LOG.info("Sending to Reminders: %r", text)
+        if not dry_run:
+            # This uses the command line "reminders" tool from
+            # https://github.com/keith/reminders-cli which only adds one item per invocation.
+            subprocess.run(["/usr/local/bin/reminders", "add", "Inbox", text], check=True)
 
 
-def cleaned(text: str, prefix: str) -> str:
+def cleaned(text: str, prefix: str, has_links: bool = True) -> str:
     """Return the line, minus the leading flag character and surrounding whitespace.
 
-    This replaces "[[Link]]" or "[[Link|alias]]" with "Link" and "alias", respectively.
+    This replaces "[[Link]]" or "[[Link|alias]]" with "Link" and "alias", respectively. Pass
+    `has_links=False` if the caller already knows there aren't any links to skip looking for them.
     """
 
     unprefixed = text.removeprefix(prefix)
+    if not has_links or "[[" not in unprefixed:
+        return unprefixed.strip()
+
     unlinked = LINK_PATTERN.sub(r"\1", unprefixed)
     return unlinked.strip()
 
 
+def _has_marker(path: Path, marker: bytes = UNPROCESSED.encode()) -> bool:
+    """Return True if the file contains the marker, without decoding its contents."""
+
+    with path.open("rb") as infile:
+        return marker in infile.read()
+
+
 def process_daily_notes(vault: Vault, action_map: Dict[str, ActionFunc], dry_run: bool):
     """Look for unprocessed notes, sent appropriate lines to various apps, and mark them done."""
 
     today = dt.date.today()
+    dispatch = dispatch_pattern(action_map)
 
     for note, note_date in daily_note_files(vault.daily_notes_dir):
-        content = note.read_text()
-        if UNPROCESSED not in content:
-            continue
-
         if note_date > today:
-            LOG.debug("Not processing future note %r", note.name)
+            # Notes are sorted by date, so every remaining one is in the future, too.
+            LOG.debug("Not processing future notes starting with %r", note.name)
+            break
+
+        if not _has_marker(note):
             continue
 
+        content = note.read_text()
         LOG.info("Processing %r from %s", note.name, note_date)
-        actions, new_content = parse(content, action_map)
+        actions, new_content = parse(content, action_map, dispatch)
 
         if new_content == "\n":
             LOG.info("Deleting newly empty file")
@@ -107,16 +135,28 @@ def process_daily_notes(vault: Vault, action_map: Dict[str, ActionFunc], dry_run
                 note.write_text(new_content)
 
         for func, items in actions.items():
-            if func is send_to_dayone:
-                func("\n\n".join(items), dry_run)
-            else:
-                for item in items:
-                    func(item, dry_run)
+            func(items, dry_run)
+
+
+def dispatch_pattern(action_map: Dict[str, ActionFunc]) -> re.Pattern:
+    """Return a regex matching the longest action prefix at the start of a line.
 
+    Longer prefixes are tried first so that "- [ ] " wins over "- ".
+    """
+
+    prefixes = sorted(action_map, key=len, reverse=True)
+    # An empty alternation would match every line, so use one that never matches instead.
+    return re.compile("|".join(map(re.escape, prefixes)) or "(?!)")
 
-def parse(text: str, action_map: Dict[str, ActionFunc]) -> Tuple[Dict[ActionFunc, List[str]], str]:
+
+def parse(
+    text: str, action_map: Dict[str, ActionFunc], dispatch: Optional[re.Pattern] = None
+) -> Tuple[Dict[ActionFunc, List[str]], str]:
     """Process the lines in the file.
 
+    `dispatch` is the `dispatch_pattern` for `action_map`. Callers parsing many notes with the same
+    action map can build it once and pass it in.
+
     Return:
     - A list of to-do actions
     - A list of journal entries
@@ -126,19 +166,19 @@ def parse(text: str, action_map: Dict[str, ActionFunc]) -> Tuple[Dict[ActionFunc
     lines = []
 
     actions: Dict[ActionFunc, List[str]] = {}
-    prefixes = tuple(action_map.keys())
-
-    for line in text.splitlines():
-        if not line.startswith(prefixes):
-            lines.append(line.replace(UNPROCESSED, "").rstrip())
+    if dispatch is None:
+        dispatch = dispatch_pattern(action_map)
+    has_links = "[[" in text
+
+    for line in text.split("\n"):
+        if not (match := dispatch.match(line)):
+            if "#" in line:
+                line = line.replace(UNPROCESSED, "")
+            lines.append(line.rstrip())
             continue
 
-        for prefix, func in action_map.items():
-            if line.startswith(prefix):
-                actions.setdefault(func, []).append(cleaned(line, prefix))
-                break
-        else:
-            raise ValueError(f"{text} didn't match any of {prefixes}.")
+        prefix = match.group()
+        actions.setdefault(action_map[prefix], []).append(cleaned(line, prefix, has_links))
 
     output_lines = remove_empty_sections(lines)
     out = "\n".join(output_lines).strip() + "\n"
@@ -149,33 +189,32 @@ def parse(text: str, action_map: Dict[str, ActionFunc]) -> Tuple[Dict[ActionFunc
 def remove_empty_sections(lines: List[str]) -> List[str]:
     """Return a copy of the list of lines with any empty # Section parts removed."""
 
-    section: List[str] = []
-    sections = [section]
+    output_lines: List[str] = []
+    start = 0
     for line in lines:
         if line.startswith("# "):
-            section = [line]
-            sections.append(section)
-        else:
-            section.append(line)
-
-    output_lines = []
-    for section in sections:
-        if not section:
-            continue
-        section = remove_empty_lines(section)
-        if len(section) > 1:
-            output_lines.extend(section + [""])
+            close_section(output_lines, start)
+            start = len(output_lines)
+        output_lines.append(line)
+    close_section(output_lines, start)
 
     return output_lines
 
 
-def remove_empty_lines(lines: List[str]) -> List[str]:
-    """Return a copy of the list of lines without any trailing empty lines."""
+def close_section(lines: List[str], start: int):
+    """Trim the trailing empty lines from the section at lines[start:], or drop it if empty.
+
+    A section that's kept gets a single empty line appended to separate it from the next.
+    """
 
-    new_lines = lines[:]
-    while new_lines and new_lines[-1] == "":
-        new_lines.pop(-1)
-    return new_lines
+    end = len(lines)
+    while end > start and lines[end - 1] == "":
+        end -= 1
+    if end - start > 1:
+        del lines[end:]
+        lines.append("")
+    else:
+        del lines[start:]
 
 
 def make_action_map(process_notes: ProcessNotes) -> Dict[str, ActionFunc]:
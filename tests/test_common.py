@@ -0,0 +1,35 @@
+import datetime as dt
+
+from glassknife.common import daily_note_files
+
+
+def test_daily_note_files(tmp_path):
+    names = [
+        "2021-01-02.md",
+        "2020-12-31.md",
+        "2099-01-01.md",
+        "2021-0١-01.md",
+        "+021-01-01.md",
+        "2_21-01-01.md",
+        " 021-01-01.md",
+        "2021-+1-01.md",
+        "2021-01- 1.md",
+        "2021-02-30.md",
+        "2021-13-01.md",
+        "2021-1-01.md",
+        "2021_01_01.md",
+        "2021-01-01.txt",
+        "Notes.md",
+    ]
+    for name in names:
+        (tmp_path / name).touch()
+
+    assert daily_note_files(tmp_path) == [
+        (tmp_path / "2020-12-31.md", dt.date(2020, 12, 31)),
+        (tmp_path / "2021-01-02.md", dt.date(2021, 1, 2)),
+        (tmp_path / "2099-01-01.md", dt.date(2099, 1, 1)),
+    ]
+
+
+def test_missing_daily_notes_dir(tmp_path):
+    assert daily_note_files(tmp_path / "missing") == []
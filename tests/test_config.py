@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from glassknife import config
+
+CONFIG = """
+vaults:
+  Everything:
+    path: /path/to/my/vault
+    notes_subdir: Daily
+    templates_subdir: Templates
+    daily_template_name: Daily.md
+
+process_notes:
+  actions:
+    "- ": Reminders
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    monkeypatch.setattr(config, "CONFIG_FILE", path)
+    monkeypatch.setattr(config, "CONFIG_CACHE_FILE", tmp_path / "cache" / "config.pkl")
+    config.load_config.cache_clear()
+    yield path
+    config.load_config.cache_clear()
+
+
+def test_cache_hit(config_file, monkeypatch):
+    first = config.load_config()
+    assert config.CONFIG_CACHE_FILE.exists()
+    config.load_config.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The YAML file shouldn't be parsed")
+
+    monkeypatch.setattr(config.yaml, "load", fail)
+    assert config.load_config() == first
+
+
+def test_cache_miss_after_yaml_changes(config_file):
+    assert config.load_config().vaults["Everything"].notes_subdir == "Daily"
+    config.load_config.cache_clear()
+
+    # Keep the old mtime to show that the size alone is enough to notice the change.
+    stat = config_file.stat()
+    config_file.write_text(CONFIG.replace("notes_subdir: Daily", "notes_subdir: Journal"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert config.load_config().vaults["Everything"].notes_subdir == "Journal"
+
+
+def test_corrupt_cache_falls_back_to_yaml(config_file):
+    config.CONFIG_CACHE_FILE.parent.mkdir()
+    config.CONFIG_CACHE_FILE.write_bytes(b"\x80\x04\x95garbage")
+
+    assert config.load_config().vaults["Everything"].notes_subdir == "Daily"
@@ -0,0 +1,62 @@
+from glassknife.config import Vault
+from glassknife.make_indexes import (
+    template_contents,
+    template_path,
+    valid_grouped_note_files,
+    write_index_file,
+)
+
+
+def test_write_new_index_file(tmp_path):
+    path = tmp_path / "index.md"
+    write_index_file(path, ["Header"], ["[[a]]", "[[b]]"], ["Footer"])
+    assert path.read_text() == "Header\n\n---\n\n[[a]]\n[[b]]\n\n---\n\nFooter"
+
+
+def test_keep_existing_header_and_footer(tmp_path):
+    path = tmp_path / "index.md"
+    path.write_text("My header\n\nmore\n\n---\n\n[[old]]\n\n---\n\nMy footer\n")
+    write_index_file(path, ["Header"], ["[[new]]"], ["Footer"])
+    assert path.read_text() == "My header\n\nmore\n\n---\n\n[[new]]\n\n---\n\nMy footer"
+
+
+def test_empty_links_block(tmp_path):
+    path = tmp_path / "index.md"
+    path.write_text("My header\n---\n---\nMy footer\n")
+    write_index_file(path, ["Header"], ["[[new]]"], ["Footer"])
+    assert path.read_text() == "My header\n\n---\n\n[[new]]\n\n---\n\nMy footer"
+
+
+def test_separator_on_first_line(tmp_path):
+    path = tmp_path / "index.md"
+    path.write_text("---\n\n[[old]]\n\n---\n\nMy footer\n")
+    write_index_file(path, ["Header"], ["[[new]]"], ["Footer"])
+    assert path.read_text() == "\n\n---\n\n[[new]]\n\n---\n\nMy footer"
+
+
+def test_prune_empty_past_notes(tmp_path):
+    vault = Vault(
+        path=tmp_path,
+        notes_subdir="notes",
+        templates_subdir="templates",
+        daily_template_name="Daily.md",
+    )
+    vault.daily_notes_dir.mkdir()
+    vault.templates_dir.mkdir()
+    template = "".join(f"# Section {i}\n\n" for i in range(100))
+    template_path(vault).write_bytes(template.encode())
+
+    (vault.daily_notes_dir / "2021-01-01.md").write_bytes(template.replace("\n", "\r\n").encode())
+    (vault.daily_notes_dir / "2021-01-02.md").write_bytes(template.encode())
+    (vault.daily_notes_dir / "2021-01-03.md").write_bytes((template + "Stuff\n").encode())
+
+    grouped = valid_grouped_note_files(vault, template_contents(vault))
+
+    assert grouped == {2021: {1: ["2021-01-03"]}}
+
+
+def test_keep_other_line_separators(tmp_path):
+    path = tmp_path / "index.md"
+    path.write_text("My header\x0cpage\n---\n---\nMy\u2028footer\n")
+    write_index_file(path, ["Header"], ["[[new]]"], ["Footer"])
+    assert path.read_text() == "My header\x0cpage\n\n---\n\n[[new]]\n\n---\n\nMy\u2028footer"
@@ -0,0 +1,115 @@
+import subprocess
+import webbrowser
+
+import pytest
+
+from glassknife.config import Vault
+from glassknife.process_notes import (
+    dispatch_pattern,
+    parse,
+    process_daily_notes,
+    send_to_dayone,
+    send_to_omnifocus,
+    send_to_reminders,
+)
+
+ACTION_MAP = {"- ": send_to_reminders, "* ": send_to_dayone, "- [ ] ": send_to_omnifocus}
+
+NOTE = """# Work
+
+- [ ] Tell boss I'm going on vacation
+
+# Personal
+
+Worked on [[Glass Knife]] project.
+* Had dim sum with [[Jane Doe|Jane]].
+Watching [[Ted Lasso]]
+- Water the plant
+
+#unprocessed
+"""
+
+
+def test_parse():
+    actions, content = parse(NOTE, ACTION_MAP, dispatch_pattern(ACTION_MAP))
+
+    assert actions == {
+        send_to_omnifocus: ["Tell boss I'm going on vacation"],
+        send_to_dayone: ["Had dim sum with Jane."],
+        send_to_reminders: ["Water the plant"],
+    }
+    assert content == "# Personal\n\nWorked on [[Glass Knife]] project.\nWatching [[Ted Lasso]]\n"
+
+
+def test_parse_without_actions():
+    actions, content = parse(NOTE, {})
+
+    assert not actions
+    assert content == NOTE.replace("#unprocessed", "").strip() + "\n"
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    """Record the commands that would have been run instead of running them."""
+
+    commands = []
+
+    def fake_run(args, **kwargs):
+        commands.append(args)
+        return subprocess.CompletedProcess(args, 0)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("Actions shouldn't go through webbrowser")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(webbrowser, "open", fail_open)
+    return commands
+
+
+def test_process_daily_notes_batches_actions(tmp_path, launches):
+    vault = Vault(
+        path=tmp_path,
+        notes_subdir="notes",
+        templates_subdir="templates",
+        daily_template_name="Daily.md",
+    )
+    vault.daily_notes_dir.mkdir()
+    note = vault.daily_notes_dir / "2021-01-01.md"
+    note.write_text(NOTE.replace("- Water the plant", "- Water the plant\n- [ ] Buy filters"))
+
+    process_daily_notes(vault, ACTION_MAP, dry_run=False)
+
+    assert launches == [
+        [
+            "/usr/bin/open",
+            "omnifocus://x-callback-url/add?name=Tell%20boss%20I%27m%20going%20on%20vacation"
+            "&autosave=true",
+            "omnifocus://x-callback-url/add?name=Buy%20filters&autosave=true",
+        ],
+        ["/usr/bin/open", "dayone2://post?entry=Had%20dim%20sum%20with%20Jane."],
+        ["/usr/local/bin/reminders", "add", "Inbox", "Water the plant"],
+    ]
+    assert note.read_text() == (
+        "# Personal\n\nWorked on [[Glass Knife]] project.\nWatching [[Ted Lasso]]\n"
+    )
+
+
+def test_dry_run_launches_nothing(launches):
+    send_to_dayone(["One", "Two"], dry_run=True)
+    send_to_omnifocus(["One", "Two"], dry_run=True)
+    send_to_reminders(["One", "Two"], dry_run=True)
+
+    assert not launches
+
+
+def test_failed_open_doesnt_stop_other_actions(monkeypatch, launches):
+    def failing_run(args, **kwargs):
+        launches.append(args)
+        return subprocess.CompletedProcess(args, 1)
+
+    monkeypatch.setattr(subprocess, "run", failing_run)
+
+    send_to_omnifocus(["One"], dry_run=False)
+    send_to_dayone(["Two"], dry_run=False)
+
+    assert len(launches) == 2